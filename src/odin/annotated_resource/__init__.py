@@ -12,6 +12,7 @@ utilised unchanged.
 
 """
 
+from operator import attrgetter
 from typing import Any, Dict, Iterable, Tuple, Type
 
 from odin import registration
@@ -40,14 +41,18 @@ def _iterate_attrs(attrs: Dict[str, Any]) -> Iterable[Tuple[str, BaseField]]:
     annotations = attrs.pop("__annotations__", None) or {}
 
     # Yield any annotations processed into field instances
+    get_value = attrs.get
+    processed = set()
     for name, type_ in annotations.items():
         # Ignore all uppercase entries (consts)
         if not name.isupper():
-            value = attrs.pop(name, NotProvided)
-            yield name, process_attribute(type_, value)
+            processed.add(name)
+            yield name, process_attribute(type_, get_value(name, NotProvided))
 
     # Process any leftover fields
-    yield from attrs.items()
+    for name, value in attrs.items():
+        if name not in processed:
+            yield name, value
 
 
 class AnnotatedResourceType(type):
@@ -61,19 +66,7 @@ class AnnotatedResourceType(type):
     ):
         super_new = super().__new__
 
-        # attrs will never be empty for classes declared in the standard way
-        # (i.e. with the `class` keyword). This is quite robust.
-        if name == "NewBase" and attrs == {}:
-            return super_new(mcs, name, bases, attrs)
-
-        parents = [
-            base
-            for base in bases
-            if (
-                isinstance(base, AnnotatedResourceType)
-                and not (base.__name__ == "NewBase" and base.__mro__ == (base, object))
-            )
-        ]
+        parents = [base for base in bases if isinstance(base, AnnotatedResourceType)]
         if not parents:
             # If this isn't a subclass of NewResource, don't do anything special.
             return super_new(mcs, name, bases, attrs)
@@ -102,25 +95,25 @@ class AnnotatedResourceType(type):
             if callable(new_meta.field_sorting):
                 new_meta.fields = new_meta.field_sorting(new_meta.fields)
             else:
-                new_meta.fields = sorted(new_meta.fields, key=hash)
+                new_meta.fields = sorted(
+                    new_meta.fields, key=attrgetter("creation_counter")
+                )
 
         # Give fields an opportunity to do additional operations after the
         # resource is full populated and ready.
         for field in new_meta.all_fields:
-            if hasattr(field, "on_resource_ready"):
-                field.on_resource_ready()
+            on_resource_ready = getattr(field, "on_resource_ready", None)
+            if on_resource_ready is not None:
+                on_resource_ready()
 
         if abstract:
             return new_class
 
-        # Register resource
+        # Register resource. Repeat registrations were already handled by the
+        # early bail-out above, so the newly registered class is the canonical
+        # one; no need to fetch it back out of the registry.
         registration.register_resources(new_class)
-
-        # Because of the way imports happen (recursively), we may or may not be
-        # the first time this model tries to register with the framework. There
-        # should only be one class for each model, so we always return the
-        # registered version.
-        return registration.get_resource(new_meta.resource_name)
+        return new_class
 
     def add_to_class(cls, name, value):
         if hasattr(value, "contribute_to_class"):
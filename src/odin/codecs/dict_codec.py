@@ -18,8 +18,9 @@ class OdinEncoder:
             return obj
         elif isinstance(o, bases.ResourceIterable):
             return list(o)
-        elif o.__class__ in TYPE_SERIALIZERS:
-            return TYPE_SERIALIZERS[o.__class__](o)
+        serializer = TYPE_SERIALIZERS.get(o.__class__)
+        if serializer is not None:
+            return serializer(o)
         return o
 
     def encode(self, o):
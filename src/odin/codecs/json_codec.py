@@ -44,8 +44,9 @@ class OdinEncoder(json.JSONEncoder):
         elif isinstance(o, LIST_TYPES):
             return list(o)
 
-        elif o.__class__ in JSON_TYPES:
-            return JSON_TYPES[o.__class__](o)
+        serializer = JSON_TYPES.get(o.__class__)
+        if serializer is not None:
+            return serializer(o)
 
         return super().default(o)
 
@@ -108,8 +108,9 @@ class OdinEncoder(toml.TomlEncoder):
             resource_dict = self.resource_to_dict(v)
             return self.dump_inline_table(resource_dict)
 
-        if type(v) in TOML_TYPES:
-            v = TOML_TYPES[type(v)](v)
+        serializer = TOML_TYPES.get(type(v))
+        if serializer is not None:
+            v = serializer(v)
         return super().dump_value(v)
 
 
@@ -39,10 +39,10 @@ class TextField(StringField):
 
 
 def _serialize_to_string(value):
-    if value.__class__ in XML_TYPES:
-        return XML_TYPES[value.__class__](value)
-    else:
-        return str(value)
+    serializer = XML_TYPES.get(value.__class__)
+    if serializer is not None:
+        return serializer(value)
+    return str(value)
 
 
 def dump(
@@ -1,3 +1,4 @@
+from sys import intern
 from typing import Callable, Optional
 
 
@@ -41,7 +42,10 @@ class BaseField:
         """Pre-populate names and accepts an optional name formatter method."""
         if not self.name:
             self.name = name_formatter(attname) if name_formatter else attname
-        self.attname = attname
+        # Interned names make the dict lookups keyed on them (field maps,
+        # to_dict, codecs) pointer comparisons in the common case.
+        self.name = intern(self.name)
+        self.attname = intern(attname)
         if self.verbose_name is None and self.name:
             self.verbose_name = self.name.replace("_", " ")
         if self.verbose_name_plural is None and self.verbose_name:
@@ -1,10 +1,13 @@
 """Mapping data between resources or other object types."""
 import abc
+import keyword
+from functools import cached_property
+from operator import attrgetter
+from types import FunctionType
 from typing import (
     Any,
     Callable,
     Dict,
-    Iterable,
     NamedTuple,
     Optional,
     Sequence,
@@ -18,9 +21,9 @@ from odin import registration
 from odin.exceptions import MappingExecutionError, MappingSetupError
 from odin.fields import Field, NotProvided
 from odin.fields.composite import DictAs, ListOf
-from odin.mapping.helpers import MapDictAs, MapListOf, NoOpMapper
+from odin.mapping.helpers import MapListOf, NoOpMapper
 from odin.resources import ResourceBase
-from odin.utils import cached_property, getmeta
+from odin.utils import getmeta
 
 __all__ = ("Mapping", "map_field", "map_list_field", "assign_field", "define", "assign")
 
@@ -41,6 +44,45 @@ def force_tuple(value: Union[_V, Sequence[_V]]) -> Sequence[_V]:
 EMPTY_LIST = ()
 
 
+_apply_mapping_cache: Dict[Any, MapListOf] = {}
+
+
+def _shared_apply_mapping(mapping) -> MapListOf:
+    """Return a shared ``ApplyMapping`` action targeting the supplied mapping.
+
+    The action is stateless apart from its target, so auto-generated
+    ListOf/DictAs rules can share a single instance per mapping rather than
+    instantiating one per field pair.
+    """
+    try:
+        return _apply_mapping_cache[mapping]
+    except KeyError:
+        action = _apply_mapping_cache[mapping] = MapListOf(mapping)
+        return action
+
+
+_attrgetter_cache: Dict[Sequence[str], Callable[[Any], Sequence[Any]]] = {}
+
+
+def _multi_attrgetter(from_fields) -> Callable[[Any], Sequence[Any]]:
+    """Return a cached ``attrgetter`` fetching multiple from-field values as a tuple."""
+    try:
+        return _attrgetter_cache[from_fields]
+    except KeyError:
+        getter = _attrgetter_cache[from_fields] = attrgetter(*from_fields)
+        return getter
+
+
+def _is_iterable(value) -> bool:
+    """Determine if a value is iterable.
+
+    Checks the common concrete types directly before falling back to an
+    ``__iter__`` lookup; equivalent to an ``Iterable`` instance check without
+    the ABC registry machinery.
+    """
+    return isinstance(value, (list, tuple)) or hasattr(value, "__iter__")
+
+
 class FieldMapping(NamedTuple):
     """Field mapping definition"""
 
@@ -173,34 +215,237 @@ class ResourceFieldResolver(FieldResolverBase):
 registration.register_field_resolver(ResourceFieldResolver, ResourceBase)
 
 
+def _value_count_error(
+    expected: int, actual: int, mapping_rule
+) -> MappingExecutionError:
+    """Build the error raised when a rule produces the wrong number of values."""
+    return MappingExecutionError(
+        f"Rule expects {expected} fields ({actual} returned) "
+        f"applying rule {mapping_rule}. The `to_list` option might need to be specified"
+    )
+
+
+def _pack_values(to_values, mapping_rule) -> dict:
+    """Normalise the value(s) produced by a mapping rule into a dict of to-field values."""
+    _, _, to_fields, to_list, _, skip_if_none = mapping_rule
+
+    if to_list:
+        if _is_iterable(to_values):
+            to_values = (list(to_values),)
+        else:
+            to_values = (to_values,)
+    elif not isinstance(to_values, tuple):
+        # force_tuple, inlined as this runs per rule application
+        to_values = tuple(to_values) if isinstance(to_values, list) else (to_values,)
+
+    if len(to_fields) != len(to_values):
+        raise _value_count_error(len(to_fields), len(to_values), mapping_rule)
+
+    if skip_if_none:
+        return {
+            f: to_values[i] for i, f in enumerate(to_fields) if to_values[i] is not None
+        }
+    else:
+        return {f: to_values[i] for i, f in enumerate(to_fields)}
+
+
+def _source_expressions(from_fields) -> Sequence[str]:
+    """Generate expressions that load each from-field off the source object."""
+    expressions = []
+    for field in from_fields:
+        if field.isidentifier() and not keyword.iskeyword(field):
+            expressions.append(f"source.{field}")
+        else:
+            expressions.append(f"getattr(source, {field!r})")
+    return expressions
+
+
+def _pack_lines(
+    to_fields, to_list: bool, skip_if_none: bool, rule_ref: str
+) -> Optional[Sequence[str]]:
+    """Generate statements that pack the local ``result`` of a rule action into ``values``.
+
+    The packing strategy (wrap as list, unpack a single value or distribute a
+    multi-value tuple) is statically known per rule, so the matching branch of
+    the generic packing logic is emitted directly. Returns :const:`None` for
+    rule shapes that cannot be specialised.
+    """
+    if to_list:
+        if len(to_fields) != 1:
+            return None
+        lines = [
+            "    if _is_iterable(result):",
+            "        result = list(result)",
+        ]
+        if skip_if_none:
+            lines += [
+                "    if result is not None:",
+                f"        values[{to_fields[0]!r}] = result",
+            ]
+        else:
+            lines.append(f"    values[{to_fields[0]!r}] = result")
+        return lines
+
+    if len(to_fields) == 1:
+        lines = [
+            "    if isinstance(result, (tuple, list)):",
+            "        if len(result) != 1:",
+            f"            raise _value_count_error(1, len(result), {rule_ref})",
+            "        result = result[0]",
+        ]
+        if skip_if_none:
+            lines += [
+                "    if result is not None:",
+                f"        values[{to_fields[0]!r}] = result",
+            ]
+        else:
+            lines.append(f"    values[{to_fields[0]!r}] = result")
+        return lines
+
+    lines = [
+        "    if not isinstance(result, (tuple, list)):",
+        "        result = (result,)",
+        f"    if len(result) != {len(to_fields)}:",
+        f"        raise _value_count_error({len(to_fields)}, len(result), {rule_ref})",
+    ]
+    for i, field in enumerate(to_fields):
+        if skip_if_none:
+            lines += [
+                f"    if result[{i}] is not None:",
+                f"        values[{field!r}] = result[{i}]",
+            ]
+        else:
+            lines.append(f"    values[{field!r}] = result[{i}]")
+    return lines
+
+
+def _build_convert(mapping_rules: Sequence[FieldMapping]):  # noqa: PLR0911, PLR0912
+    """Generate a specialised ``convert`` implementation for a set of mapping rules.
+
+    The generic ``convert``/``_apply_rule`` pair re-interprets each rule tuple on
+    every call; once a mapping class has been built its rules are fixed, so a
+    dedicated function can be generated with each rule inlined and the dispatch
+    decisions already taken. Returns :const:`None` if the rules cannot be
+    compiled (the generic implementation remains in place).
+    """
+    namespace = {
+        "_is_iterable": _is_iterable,
+        "MappingExecutionError": MappingExecutionError,
+        "_value_count_error": _value_count_error,
+    }
+    lines = [
+        "def convert(self, **field_values):",
+        "    if self.ignore_not_provided:",
+        "        return _generic_convert(self, **field_values)",
+        "    source = self.source",
+        "    values = field_values",
+    ]
+
+    for idx, rule in enumerate(mapping_rules):
+        if not isinstance(rule, FieldMapping):
+            return None
+        from_fields, action, to_fields, to_list, bind, skip_if_none = rule
+        if not all(isinstance(f, str) for f in to_fields):
+            return None
+
+        if from_fields is None:
+            args = []
+        elif all(isinstance(f, str) for f in from_fields):
+            args = list(_source_expressions(from_fields))
+        else:
+            return None
+
+        rule_ref = f"_rule_{idx}"
+        namespace[rule_ref] = rule
+
+        if action is None:
+            # The arity of both sides is statically known; values can be
+            # assigned (or the arity error raised) without any packing.
+            if to_list:
+                if len(to_fields) != 1:
+                    return None
+                lines.append(f"    values[{to_fields[0]!r}] = [{', '.join(args)}]")
+            elif len(args) != len(to_fields):
+                lines.append(
+                    f"    raise _value_count_error({len(to_fields)}, {len(args)}, {rule_ref})"
+                )
+            elif skip_if_none:
+                for field, arg in zip(to_fields, args):
+                    lines += [
+                        f"    value = {arg}",
+                        "    if value is not None:",
+                        f"        values[{field!r}] = value",
+                    ]
+            else:
+                for field, arg in zip(to_fields, args):
+                    lines.append(f"    values[{field!r}] = {arg}")
+            continue
+
+        if isinstance(action, str):
+            if not (action.isidentifier() and not keyword.iskeyword(action)):
+                return None
+            call = f"self.{action}"
+        else:
+            call = f"_action_{idx}"
+            namespace[call] = action
+        if args:
+            # Load the from-field values into locals ahead of the call so a
+            # TypeError raised by a source attribute propagates unchanged,
+            # matching the generic _apply_rule.
+            names = [f"arg_{i}" for i in range(len(args))]
+            lines += [f"    {n} = {a}" for n, a in zip(names, args)]
+            args = names
+        if bind:
+            args.insert(0, "self")
+
+        pack_lines = _pack_lines(to_fields, to_list, skip_if_none, rule_ref)
+        if pack_lines is None:
+            return None
+
+        lines += [
+            "    try:",
+            f"        result = {call}({', '.join(args)})",
+            "    except TypeError as ex:",
+            f'        raise MappingExecutionError(f"{{ex}} applying rule {{{rule_ref}}}") from ex',
+        ]
+        lines += pack_lines
+
+    lines.append("    return self.create_object(**values)")
+
+    namespace["_generic_convert"] = MappingBase.convert
+    # Deliberate use of exec: the source is assembled above purely from rule
+    # definitions already validated by MappingMeta, never from user input.
+    exec(  # noqa: S102
+        compile("\n".join(lines), "<odin.mapping generated>", "exec"), namespace
+    )
+    convert = namespace["convert"]
+    convert.__doc__ = MappingBase.convert.__doc__
+    convert._generated = True
+    return convert
+
+
 class MappingMeta(type):
     """Metaclass for all Mappings"""
 
     def __new__(mcs, name, bases, attrs):
         super_new = super().__new__
 
-        # attrs will never be empty for classes declared in the standard way
-        # (ie. with the `class` keyword). This is quite robust.
-        if name == "NewBase" and attrs == {}:
-            return super_new(mcs, name, bases, attrs)
-
-        parents = [
-            b
-            for b in bases
-            if isinstance(b, MappingMeta)
-            and not (b.__name__ == "NewBase" and b.__mro__ == (b, MappingBase, object))
-        ]
+        parents = [b for b in bases if isinstance(b, MappingMeta)]
         if not parents:
             # If this isn't a subclass of Mapping, don't do anything special.
             return super_new(mcs, name, bases, attrs)
 
         # Backward compatibility from_resource -> from_obj
-        from_obj = attrs.setdefault("from_obj", attrs.get("from_resource"))
+        from_obj = attrs.get("from_obj")
         if from_obj is None:
-            raise MappingSetupError("`from_obj` is not defined.")
-        to_obj = attrs.setdefault("to_obj", attrs.get("to_resource"))
+            from_obj = attrs["from_obj"] = attrs.get("from_resource")
+            if from_obj is None:
+                raise MappingSetupError("`from_obj` is not defined.")
+        to_obj = attrs.get("to_obj")
         if to_obj is None:
-            raise MappingSetupError("`to_obj` is not defined.")
+            to_obj = attrs["to_obj"] = attrs.get("to_resource")
+            if to_obj is None:
+                raise MappingSetupError("`to_obj` is not defined.")
         register_mapping = attrs.pop("register_mapping", True)
 
         # Check if we have already created this mapping
@@ -285,17 +530,18 @@ class MappingMeta(type):
 
             return FieldMapping(map_from, action, map_to, to_list, bind, skip_if_none)
 
-        # Determine what fields need to have mappings generated
-        exclude_fields = attrs.get("exclude_fields") or ()
-        unmapped_fields = [
-            attname for attname in from_fields if attname not in exclude_fields
-        ]
+        # Determine what fields need to have mappings generated; a dict is used
+        # in place of a set to keep field order (and hence rule order) stable.
+        exclude_fields = frozenset(attrs.get("exclude_fields") or ())
+        unmapped_fields = {
+            attname: None for attname in from_fields if attname not in exclude_fields
+        }
 
         def remove_from_unmapped_fields(rule):
-            # Remove any fields that are handled by a mapping rule from unmapped_fields list.
+            # Remove any fields that are handled by a mapping rule from unmapped_fields.
             map_to = rule[2]
-            if len(map_to) == 1 and map_to[0] in unmapped_fields:
-                unmapped_fields.remove(map_to[0])
+            if len(map_to) == 1:
+                unmapped_fields.pop(map_to[0], None)
 
         # Generate mapping rules.
         mapping_rules = []
@@ -348,8 +594,23 @@ class MappingMeta(type):
         attrs["_mapping_rules"] = mapping_rules
         attrs["_subs"] = {}
 
+        # Generate a specialised convert method unless one has been supplied
+        # (either directly or by a parent mapping).
+        inherited_convert = next(
+            (b.convert for b in bases if hasattr(b, "convert")), None
+        )
+        if "convert" not in attrs and (
+            inherited_convert is None
+            or inherited_convert is MappingBase.convert
+            or getattr(inherited_convert, "_generated", False)
+        ):
+            convert = _build_convert(mapping_rules)
+            if convert is not None:
+                attrs["convert"] = convert
+
         # Create mapper instance
         mapper = super_new(mcs, name, bases, attrs)
+        mapper._resolved_rules = mcs.resolve_rule_actions(mapper, mapping_rules)
         if register_mapping:
             registration.register_mapping(mapper)
             mapper = registration.get_mapping(from_obj, to_obj)
@@ -360,6 +621,44 @@ class MappingMeta(type):
 
         return mapper
 
+    @classmethod
+    def resolve_rule_actions(mcs, mapper, mapping_rules):
+        """Resolve string action names into their callables once the class exists.
+
+        String actions in ``_mapping_rules`` require a ``getattr``/``isinstance``
+        round trip on every rule application; this produces a parallel rule list
+        with those lookups already performed, used by ``convert``/``update``/
+        ``diff``. Rules that cannot be resolved are carried over unchanged.
+        """
+        return [mcs._resolve_rule_action(mapper, rule) for rule in mapping_rules]
+
+    @staticmethod
+    def _resolve_rule_action(mapper, rule):
+        """Resolve a single rule's string action name via the class MRO."""
+        action = rule.action if isinstance(rule, FieldMapping) else None
+        if isinstance(action, str):
+            for klass in mapper.__mro__:
+                if action in klass.__dict__:
+                    raw_action = klass.__dict__[action]
+                    break
+            else:
+                raw_action = None
+
+            if isinstance(raw_action, staticmethod):
+                # Static methods are not passed the mapping instance
+                rule = rule._replace(action=raw_action.__func__)
+            elif isinstance(raw_action, classmethod):
+                rule = rule._replace(action=getattr(mapper, action))
+            elif isinstance(raw_action, FunctionType) and not rule.bind:
+                # A plain method; the implicit self becomes the bind argument
+                rule = rule._replace(action=raw_action, bind=True)
+            elif callable(raw_action) and not hasattr(raw_action, "__get__"):
+                # A callable object in the class body (eg a JoinFields
+                # instance); not a descriptor, so it is called exactly as
+                # getattr would return it.
+                rule = rule._replace(action=raw_action)
+        return rule
+
     @classmethod
     def generate_auto_mapping(mcs, name, from_fields, to_fields):
         """Generate the auto mapping between two fields."""
@@ -384,7 +683,7 @@ class MappingMeta(type):
             mapping = registration.get_mapping(from_field.of, to_field.of)
             return FieldMapping(
                 name,
-                MapListOf(mapping),
+                _shared_apply_mapping(mapping),
                 name,
                 to_list=False,
                 bind=True,
@@ -396,7 +695,7 @@ class MappingMeta(type):
             if from_field.of is to_field.of:
                 return FieldMapping(
                     name,
-                    MapListOf(NoOpMapper),
+                    _shared_apply_mapping(NoOpMapper),
                     name,
                     to_list=False,
                     bind=True,
@@ -407,12 +706,12 @@ class MappingMeta(type):
     def generate_dict_to_dict_mapping(mcs, name, from_field, to_field):
         try:
             mapping = registration.get_mapping(from_field.of, to_field.of)
-            return define(name, MapDictAs(mapping), name, bind=True)
+            return define(name, _shared_apply_mapping(mapping), name, bind=True)
         except KeyError:
             # If both items are from and to fields refer to the same object automatically use a mapper that just
             # produces a clone.
             if from_field.of is to_field.of:
-                return define(name, MapDictAs(NoOpMapper), name, bind=True)
+                return define(name, _shared_apply_mapping(NoOpMapper), name, bind=True)
 
 
 class MappingResult(base_types.TypedResourceIterable):
@@ -427,11 +726,23 @@ class MappingResult(base_types.TypedResourceIterable):
         self.mapping_options = mapping_options
 
     def __iter__(self):
-        self.context["_loop_idx"].append(0)
+        # Hoist the per-item lookups out of the loop; items of the expected
+        # type are converted directly, anything else (sub-classes, nested
+        # sequences) takes the full dispatch in Mapping.apply.
+        mapping = self.mapping
+        context = self.context
+        mapping_options = self.mapping_options
+        from_obj = None if hasattr(mapping.from_obj, "__iter__") else mapping.from_obj
+
+        loop_idx = context["_loop_idx"]
+        loop_idx.append(0)
         for item in self.sequence:
-            yield self.mapping.apply(item, self.context, *self.mapping_options)
-            self.context["_loop_idx"][-1] += 1
-        self.context["_loop_idx"].pop()
+            if item.__class__ is from_obj:
+                yield mapping(item, context).convert()
+            else:
+                yield mapping.apply(item, context, *mapping_options)
+            loop_idx[-1] += 1
+        loop_idx.pop()
 
 
 class ImmediateResult(base_types.ResourceIterable):
@@ -479,6 +790,8 @@ class CachingMappingResult(MappingResult):
 
 
 class MappingBase:
+    __slots__ = ("source", "context", "ignore_not_provided", "_loop_idx")
+
     from_obj: Optional[type] = None
     to_obj: Optional[type] = None
 
@@ -494,6 +807,7 @@ class MappingBase:
     register_mapping = True
 
     _mapping_rules = None
+    _resolved_rules = None
 
     @classmethod
     def apply(
@@ -569,24 +883,25 @@ class MappingBase:
         self.source = source_obj
         self.context = context or {}
         self.ignore_not_provided = ignore_not_provided
+        self._loop_idx = self.context.setdefault("_loop_idx", [])
 
     @property
     def loop_idx(self):
         """Index within a loop of this mapping (note loop might be for a parent object)
         :returns: Index within the loop; or `None` if we are not currently in a loop.
         """
-        loops = self.context.setdefault("_loop_idx", [])
+        loops = self._loop_idx
         return loops[-1] if loops else None
 
     @property
     def loop_level(self):
         """How many layers of loops are we in?"""
-        return len(self.context.setdefault("_loop_idx", []))
+        return len(self._loop_idx)
 
     @property
     def in_loop(self):
         """Is this mapping currently in a loop?"""
-        return bool(self.context.setdefault("_loop_idx", []))
+        return bool(self._loop_idx)
 
     def default_action(self, value):
         """The default action used when mapping. This is a bit of a special case in that it defaults to being bound
@@ -599,15 +914,31 @@ class MappingBase:
 
         return value
 
-    def _apply_rule(self, mapping_rule):
+    def _apply_rule(self, mapping_rule):  # noqa: PLR0912
         # Unpack mapping definition and fetch from values
         from_fields, action, to_fields, to_list, bind, skip_if_none = mapping_rule
 
+        # Fast path for the common field-copied-straight-across rule
+        if (
+            action is None
+            and not to_list
+            and from_fields is not None
+            and len(from_fields) == 1 == len(to_fields)
+        ):
+            value = getattr(self.source, from_fields[0])
+            if (skip_if_none and value is None) or (
+                self.ignore_not_provided and value is NotProvided
+            ):
+                return {}
+            return {to_fields[0]: value}
+
         # This is an assignment rather than a mapping
         if from_fields is None:
             from_values = EMPTY_LIST
+        elif len(from_fields) == 1:
+            from_values = (getattr(self.source, from_fields[0]),)
         else:
-            from_values = tuple(getattr(self.source, f) for f in from_fields)
+            from_values = _multi_attrgetter(tuple(from_fields))(self.source)
 
         if action is None:
             to_values = from_values
@@ -625,28 +956,7 @@ class MappingBase:
                     f"{ex} applying rule {mapping_rule}"
                 ) from ex
 
-        if to_list:
-            if isinstance(to_values, Iterable):
-                to_values = (list(to_values),)
-            else:
-                to_values = (to_values,)
-        else:
-            to_values = force_tuple(to_values)
-
-        if len(to_fields) != len(to_values):
-            raise MappingExecutionError(
-                f"Rule expects {len(to_fields)} fields ({len(to_values)} returned) "
-                f"applying rule {mapping_rule}. The `to_list` option might need to be specified"
-            )
-
-        if skip_if_none:
-            result = {
-                f: to_values[i]
-                for i, f in enumerate(to_fields)
-                if to_values[i] is not None
-            }
-        else:
-            result = {f: to_values[i] for i, f in enumerate(to_fields)}
+        result = _pack_values(to_values, mapping_rule)
 
         if self.ignore_not_provided:
             return {k: v for k, v in result.items() if v is not NotProvided}
@@ -668,8 +978,10 @@ class MappingBase:
         """
         values = field_values
 
-        for mapping_rule in self._mapping_rules:
-            values.update(self._apply_rule(mapping_rule))
+        apply_rule = self._apply_rule
+        update_values = values.update
+        for mapping_rule in self._resolved_rules or self._mapping_rules:
+            update_values(apply_rule(mapping_rule))
 
         return self.create_object(**values)
 
@@ -690,8 +1002,9 @@ class MappingBase:
         """
         ignore_fields = ignore_fields or []
 
-        for mapping_rule in self._mapping_rules:
-            for name, value in self._apply_rule(mapping_rule).items():
+        apply_rule = self._apply_rule
+        for mapping_rule in self._resolved_rules or self._mapping_rules:
+            for name, value in apply_rule(mapping_rule).items():
                 if not (
                     (name in ignore_fields)
                     or (fields and name not in fields)
@@ -712,8 +1025,9 @@ class MappingBase:
 
         """
         diff_fields = set()
-        for mapping_rule in self._mapping_rules:
-            for name, value in self._apply_rule(mapping_rule).items():
+        apply_rule = self._apply_rule
+        for mapping_rule in self._resolved_rules or self._mapping_rules:
+            for name, value in apply_rule(mapping_rule).items():
                 if not (
                     (value == getattr(destination_obj, name))
                     and (ignore_not_provided and value is NotProvided)
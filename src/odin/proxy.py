@@ -7,6 +7,7 @@ The resource proxy is an object that provides an alternate interface to a shadow
 This could be as a means of providing a summary object, or for adding additional properties.
 
 """
+from operator import attrgetter
 from typing import Optional
 
 from odin import registration
@@ -150,17 +151,7 @@ class ResourceProxyType(type):
     def __new__(mcs, name, bases, attrs):
         super_new = super().__new__
 
-        # attrs will never be empty for classes declared in the standard way
-        # (ie. with the `class` keyword). This is quite robust.
-        if name == "NewBase" and attrs == {}:
-            return super_new(mcs, name, bases, attrs)
-
-        parents = [
-            b
-            for b in bases
-            if isinstance(b, ResourceProxyType)
-            and not (b.__name__ == "NewBase" and b.__mro__ == (b, object))
-        ]
+        parents = [b for b in bases if isinstance(b, ResourceProxyType)]
         if not parents:
             # If this isn't a subclass of Resource, don't do anything special.
             return super_new(mcs, name, bases, attrs)
@@ -199,7 +190,9 @@ class ResourceProxyType(type):
             if callable(new_meta.field_sorting):
                 new_meta.fields = new_meta.field_sorting(new_meta.fields)
             else:
-                new_meta.fields = sorted(new_meta.fields, key=hash)
+                new_meta.fields = sorted(
+                    new_meta.fields, key=attrgetter("creation_counter")
+                )
 
         # Generate field descriptors
         for field in new_meta.fields:
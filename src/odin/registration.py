@@ -4,6 +4,11 @@ from odin.utils import getmeta
 
 
 def generate_mapping_cache_name(from_obj, to_obj):
+    """Generate a unique name for a mapping.
+
+    Retained for backwards compatibility; the mapping registry is now keyed
+    directly on the (from_obj, to_obj) pair.
+    """
     return f"{from_obj.__module__}.{from_obj.__name__} > {to_obj.__module__}.{to_obj.__name__}"
 
 
@@ -67,8 +72,7 @@ class ResourceCache:
         :param mapping: Mapping object to register.
 
         """
-        mapping_name = generate_mapping_cache_name(mapping.from_obj, mapping.to_obj)
-        self.mappings[mapping_name] = mapping
+        self.mappings[(mapping.from_obj, mapping.to_obj)] = mapping
 
     def get_mapping(self, from_obj, to_obj):
         """
@@ -80,8 +84,7 @@ class ResourceCache:
         :raises: KeyError if a mapping cannot be found.
 
         """
-        mapping_name = generate_mapping_cache_name(from_obj, to_obj)
-        return self.mappings[mapping_name]
+        return self.mappings[(from_obj, to_obj)]
 
     def register_field_resolver(self, resolver, base_type):
         """
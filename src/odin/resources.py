@@ -1,4 +1,5 @@
 import copy
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
@@ -254,7 +255,12 @@ class ResourceOptions:
         if self._key_fields:
             field_names.update(f.attname for f in self._key_fields)
 
-        return tuple(sorted((self.field_map[f] for f in field_names), key=hash))
+        return tuple(
+            sorted(
+                (self.field_map[f] for f in field_names),
+                key=attrgetter("creation_counter"),
+            )
+        )
 
     @cached_property
     def readonly_fields(self) -> Sequence[BaseField]:
@@ -342,17 +348,7 @@ class ResourceType(type):
     def __new__(mcs, name, bases, attrs):
         super_new = super().__new__
 
-        # attrs will never be empty for classes declared in the standard way
-        # (i.e. with the `class` keyword). This is quite robust.
-        if name == "NewBase" and attrs == {}:
-            return super_new(mcs, name, bases, attrs)
-
-        parents = [
-            b
-            for b in bases
-            if isinstance(b, ResourceType)
-            and not (b.__name__ == "NewBase" and b.__mro__ == (b, object))
-        ]
+        parents = [b for b in bases if isinstance(b, ResourceType)]
         if not parents:
             # If this isn't a subclass of Resource, don't do anything special.
             return super_new(mcs, name, bases, attrs)
@@ -381,7 +377,9 @@ class ResourceType(type):
             if callable(new_meta.field_sorting):
                 new_meta.fields = new_meta.field_sorting(new_meta.fields)
             else:
-                new_meta.fields = sorted(new_meta.fields, key=hash)
+                new_meta.fields = sorted(
+                    new_meta.fields, key=attrgetter("creation_counter")
+                )
 
         # If a key_field is defined ensure it exists
         for field_name in new_meta.key_field_names or ():
@@ -393,8 +391,9 @@ class ResourceType(type):
         # Give fields an opportunity to do additional operations after the
         # resource is full populated and ready.
         for field in new_meta.all_fields:
-            if hasattr(field, "on_resource_ready"):
-                field.on_resource_ready()
+            on_resource_ready = getattr(field, "on_resource_ready", None)
+            if on_resource_ready is not None:
+                on_resource_ready()
 
         if new_meta.abstract:
             return new_class
@@ -4,8 +4,8 @@ import pytest
 
 from odin.exceptions import MappingExecutionError, MappingSetupError
 from odin.fields import NotProvided
-from odin.mapping import FieldMapping, MappingResult
-from odin.mapping.helpers import MapDictAs, MapListOf, NoOpMapper
+from odin.mapping import FieldMapping, MappingBase, MappingResult, _build_convert
+from odin.mapping.helpers import JoinFields, MapDictAs, MapListOf, NoOpMapper
 
 from .resources import *
 
@@ -618,3 +618,166 @@ class TestSubClassMapping:
             ResourceAToResourceX.apply(ResourceD())
 
         assert "`source_resource` parameter must be an instance of" in str(cm.value)
+
+
+class JoinFromResource(odin.Resource):
+    first = odin.StringField()
+    second = odin.StringField()
+
+
+class JoinToResource(odin.Resource):
+    combined = odin.StringField()
+
+
+class JoinFromToMapping(odin.Mapping):
+    from_obj = JoinFromResource
+    to_obj = JoinToResource
+
+    join = JoinFields(sep=" ")
+
+    mappings = [odin.define(("first", "second"), "join", "combined")]
+
+
+class TestCallableObjectActions:
+    """String actions can name a callable object in the class body (eg a
+    ``JoinFields`` instance); these are not descriptor-bound so must be called
+    without the mapping instance.
+    """
+
+    def test_convert(self):
+        target = JoinFromToMapping.apply(JoinFromResource(first="x", second="y"))
+
+        assert "x y" == target.combined
+
+    def test_convert_ignore_not_provided(self):
+        source = JoinFromResource(first="x", second="y")
+        target = JoinFromToMapping(source, ignore_not_provided=True).convert()
+
+        assert "x y" == target.combined
+
+    def test_update(self):
+        target = JoinToResource(combined="")
+        JoinFromToMapping(JoinFromResource(first="x", second="y")).update(target)
+
+        assert "x y" == target.combined
+
+    def test_diff(self):
+        source = JoinFromResource(first="x", second="y")
+
+        assert {"combined"} == JoinFromToMapping(source).diff(JoinToResource())
+
+
+class GenFromResource(odin.Resource):
+    title = odin.StringField()
+    count = odin.IntegerField(null=True)
+    names = odin.TypedArrayField(odin.StringField())
+
+
+class GenToResource(odin.Resource):
+    title = odin.StringField()
+    count = odin.IntegerField(null=True)
+    names = odin.TypedArrayField(odin.StringField())
+    first = odin.StringField(null=True)
+    second = odin.StringField(null=True)
+    title_upper = odin.StringField(null=True)
+    assigned = odin.StringField(null=True)
+    tagged = odin.StringField(null=True)
+
+
+def tag_source(mapping):
+    return f"tag:{mapping.source.title}"
+
+
+class GenFromToMapping(odin.Mapping):
+    from_obj = GenFromResource
+    to_obj = GenToResource
+
+    mappings = [
+        odin.define("count", to_field="count", skip_if_none=True),
+        odin.define("title", str.upper, "title_upper"),
+        odin.assign("tagged", tag_source),
+    ]
+
+    @odin.map_field(from_field="title", to_field=("first", "second"))
+    def split_title(self, value):
+        return value.split(" ", 1)
+
+    @odin.map_list_field(from_field="names", to_field="names")
+    def upper_names(self, values):
+        return (n.upper() for n in values)
+
+    @odin.assign_field
+    def assigned(self):
+        return "assigned-value"
+
+
+class TestGeneratedConvert:
+    """The convert implementation generated by MappingMeta must match the
+    generic MappingBase.convert across every specialised rule shape.
+    """
+
+    @staticmethod
+    def assert_parity(source):
+        generated = GenFromToMapping(source).convert()
+        generic = MappingBase.convert(GenFromToMapping(source))
+
+        assert generated.to_dict() == generic.to_dict()
+        return generated
+
+    def test_convert_is_generated(self):
+        assert GenFromToMapping.convert._generated is True
+
+    def test_parity(self):
+        target = self.assert_parity(
+            GenFromResource(title="a b", count=3, names=["x", "y"])
+        )
+
+        assert "a b" == target.title
+        assert 3 == target.count
+        assert ["X", "Y"] == target.names
+        assert "a" == target.first
+        assert "b" == target.second
+        assert "A B" == target.title_upper
+        assert "assigned-value" == target.assigned
+        assert "tag:a b" == target.tagged
+
+    def test_parity_skip_if_none(self):
+        target = self.assert_parity(GenFromResource(title="a b", count=None, names=[]))
+
+        assert target.count is None
+
+    def test_parity_arity_error(self):
+        # split_title returns a single value for two target fields
+        source = GenFromResource(title="oneword", count=1, names=[])
+
+        with pytest.raises(MappingExecutionError):
+            GenFromToMapping(source).convert()
+        with pytest.raises(MappingExecutionError):
+            MappingBase.convert(GenFromToMapping(source))
+
+    def test_ignore_not_provided_falls_back_to_generic(self):
+        source = GenFromResource(title="a b", count=2, names=["x"])
+        target = GenFromToMapping(source, ignore_not_provided=True).convert()
+
+        assert "A B" == target.title_upper
+
+    def test_overridden_convert_suppresses_generation(self):
+        class CustomConvertMapping(odin.Mapping):
+            from_obj = GenFromResource
+            to_obj = GenToResource
+            register_mapping = False
+
+            def convert(self, **field_values):
+                return "custom"
+
+        assert not getattr(CustomConvertMapping.convert, "_generated", False)
+        assert "custom" == CustomConvertMapping(GenFromResource(title="t")).convert()
+
+    def test_build_convert_bails_on_unexpected_rules(self):
+        assert _build_convert([None]) is None
+        assert (
+            _build_convert(
+                [FieldMapping(("title",), None, (123,), False, False, False)]
+            )
+            is None
+        )